@@ -0,0 +1,732 @@
+from typing import (
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Tuple
+)
+import os
+import itertools
+import threading
+import pcbnew
+import json
+import wx
+import wx.dataview as dv
+import sys
+from pcbnew import (
+    BOARD, 
+    FOOTPRINT,
+    PCB_FIELD,
+    ActionPlugin,
+    SETTINGS_MANAGER,
+    Refresh,
+        GetBoard,
+        LoadBoard,
+        SaveBoard
+)
+import requests
+from .partdb.part import Part
+from .partdb.api import PartDB
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+STORAGE_LOCATION_FIELD_NAME = "Storage_Location"
+PARTDB_ID_FIELD_NAME = "PartDB_ID"
+MPN_FIELD_NAME = "MPN"
+
+def _null_last_key(key:Tuple[Optional[str],Optional[str]]) -> Tuple[bool,str,bool,str]:
+    """Sort key for (MPN, PartDB ID) groups, missing values sort last"""
+    mpn, partdb_id = key
+    return (mpn is None, mpn or "", partdb_id is None, partdb_id or "")
+
+#TODO:Remove
+# class SortableKey:
+#     """Wrapper that allows None values to be compared"""
+#     def __init__(self, value):
+#         self.value = value
+    
+#     def __lt__(self, other):
+#         # None is always "greater" (sorts last)
+#         if self.value is None:
+#             return False
+#         if other.value is None:
+#             return True
+#         return self.value < other.value
+    
+#     def __eq__(self, other):
+#         return self.value == other.value
+    
+#     def __le__(self, other):
+#         return self < other or self == other
+    
+#     def __gt__(self, other):
+#         return not (self <= other)
+    
+#     def __ge__(self, other):
+#         return not (self < other)
+    
+#     def __repr__(self):
+#         return f"SortableKey({self.value})"
+
+class FootprintData:
+    __slots__ = (
+        'footprint', '_partdb_part',
+        'reference', 'mpn', 'partdb_id', 'storage_location', 'amount'
+    )
+    footprint:FOOTPRINT
+    _partdb_part:Optional[Part]
+    # Plain attributes snapshotted from the board and the PartDB part,
+    # every pcbnew getter is a call across the SWIG boundary
+    reference:str
+    mpn:Optional[str]
+    partdb_id:Optional[str]
+    storage_location:Optional[str]
+    amount:Optional[str]
+    
+    """Data holder for footprint and associated PartDB part."""
+    def __init__(self, footprint:FOOTPRINT, partdb_part:Optional[Part]=None) -> None:
+        self.footprint = footprint
+        reference:PCB_FIELD = footprint.Reference()
+        self.reference = reference.GetText()
+        self.mpn = self._field_text(MPN_FIELD_NAME)
+        self.partdb_id = self._field_text(PARTDB_ID_FIELD_NAME)
+        self.partdb_part = partdb_part
+    
+    def _field_text(self, name:str) -> Optional[str]:
+        '''
+        Text of a field, interned since many footprints share it. None if missing or empty
+        '''
+        field:Optional[PCB_FIELD] = self.footprint.GetFieldByName(name)
+        if not field:
+            return None
+        text:str = field.GetText()
+        return sys.intern(text) if text != "" else None
+    
+    @property
+    def partdb_part(self) -> Optional[Part]:
+        return self._partdb_part
+    
+    @partdb_part.setter
+    def partdb_part(self, partdb_part:Optional[Part]) -> None :
+        self._partdb_part = partdb_part
+        self.storage_location = None
+        self.amount = None
+        if not partdb_part:
+            return
+        part_lots = partdb_part.partLots
+        if len(part_lots) > 0:
+            self.storage_location = ', '.join([part_lot.storage_location.name for part_lot in part_lots])
+            self.amount = str(sum(part_lot.amount for part_lot in part_lots))
+    
+    @property
+    def is_dirty(self) -> bool:
+        '''
+        True if the board does not hold the current storage location yet
+        '''
+        # Looked up again, the board may have replaced the field since loading
+        field:Optional[PCB_FIELD] = self.footprint.GetFieldByName(STORAGE_LOCATION_FIELD_NAME)
+        storage_location = self.storage_location or ''
+        if not field:
+            # Nothing to create without a location
+            return storage_location != ''
+        return field.GetText() != storage_location
+
+    def update_storage_location(self) -> None:
+        '''
+        Updates or creates a Field STORAGE_LOCATION_FIELD_NAME 
+        '''
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'attempting to update or create Storage Location field on part {self.reference}')
+        storage_location = self.storage_location
+        if self.footprint.HasFieldByName(STORAGE_LOCATION_FIELD_NAME):
+            # Field exists, update it
+            self.footprint.SetField(STORAGE_LOCATION_FIELD_NAME, storage_location if storage_location else '')
+            return
+        
+        field = PCB_FIELD(self.footprint,self.footprint.GetNextFieldId(),STORAGE_LOCATION_FIELD_NAME)
+        field.SetText(storage_location or '')
+        field.SetVisible(False)
+        self.footprint.AddField(field)
+
+    @staticmethod
+    def batch_update_storage_location(items:Iterable['FootprintData']) -> int:
+        '''
+        Updates the storage location field of all dirty items and refreshes pcbnew once at the end.
+        Returns the number of updated footprints.
+        '''
+        count = 0
+        for fp in items:
+            if not fp.is_dirty:
+                continue
+            fp.update_storage_location()
+            count += 1
+        if count:
+            pcbnew.Refresh()
+        logger.debug(f'Updated storage location on {count} footprints')
+        return count
+
+
+# ============================================================================
+# PANEL: API Configuration
+# ============================================================================
+class ApiConfigPanel(wx.Panel):
+    """Panel for API URL, token, and synchronize button"""
+    
+    def __init__(self, parent:wx.Window, api_url: str, token: str, on_sync_click: Callable):
+        super().__init__(parent)
+        self.on_sync_click = on_sync_click
+        
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        
+        # API URL
+        url_label = wx.StaticText(self, label="PartDB API URL:")
+        sizer.Add(url_label, 0, wx.LEFT | wx.TOP | wx.RIGHT, 10)
+        
+        self.api_url_ctrl = wx.TextCtrl(self, value=api_url)
+        self.api_url_ctrl.SetMinSize((480, 25))
+        sizer.Add(self.api_url_ctrl, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
+        
+        # Token
+        token_label = wx.StaticText(self, label="Token:")
+        sizer.Add(token_label, 0, wx.LEFT | wx.TOP | wx.RIGHT, 10)
+        
+        self.token_ctrl = wx.TextCtrl(self, value=token, style=wx.TE_PASSWORD)
+        self.token_ctrl.SetMinSize((480, 25))
+        sizer.Add(self.token_ctrl, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
+        
+        # Button row
+        button_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        button_sizer.AddStretchSpacer()
+
+        #TODO:Connect Button
+        # self.sync_btn = wx.Button(self, label="Connect")
+        # self.sync_btn.Bind(wx.EVT_BUTTON, self._on_connect_click)
+        # button_sizer.Add(self.sync_btn, 0, wx.ALL | wx.CENTER, 5)
+        
+        self.sync_btn = wx.Button(self, label="Synchronize")
+        self.sync_btn.Bind(wx.EVT_BUTTON, self._on_sync_btn_click)
+        button_sizer.Add(self.sync_btn, 0, wx.ALL | wx.CENTER, 5)
+        
+        self.clear_cache_btn = wx.Button(self, label="Clear Cache")
+        self.clear_cache_btn.Bind(wx.EVT_BUTTON, lambda evt: self.on_sync_click("clear_cache", self.get_values()))
+        button_sizer.Add(self.clear_cache_btn, 0, wx.ALL | wx.CENTER, 5)
+        
+        self.save_config_btn = wx.Button(self, label="Save Configuration")
+        self.save_config_btn.Bind(wx.EVT_BUTTON, lambda evt: self.on_sync_click("save_config", self.get_values()))
+        button_sizer.Add(self.save_config_btn, 0, wx.ALL | wx.CENTER, 5)
+        
+        sizer.Add(button_sizer, 0, wx.EXPAND | wx.ALL, 10)
+        
+        self.SetSizer(sizer)
+    
+    def _on_sync_btn_click(self, event):
+        self.on_sync_click("sync", self.get_values())
+    
+    def get_values(self) -> Tuple[str, str]:
+        """Return current API URL and token"""
+        return (self.api_url_ctrl.GetValue().strip(), self.token_ctrl.GetValue().strip())
+    
+    def set_values(self, api_url: str, token: str):
+        """Update displayed values"""
+        self.api_url_ctrl.SetValue(api_url)
+        self.token_ctrl.SetValue(token)
+
+
+# ============================================================================
+# PANEL: Footprint Table
+# ============================================================================
+class FootprintTreeModel(dv.PyDataViewModel):
+    """
+    Virtual tree model for the BOM view.
+
+    Top level rows are the (MPN, PartDB ID) groups, their children the grouped
+    footprints. The DataViewCtrl only queries values of rows it displays, so
+    collapsed groups never cost anything.
+    """
+    footprints_data_grouped:dict[Tuple[Optional[str],Optional[str]],List[FootprintData]]
+    sorted_group_keys:List[Tuple[Optional[str],Optional[str]]]
+
+    def __init__(self, footprints_data_grouped: dict, sorted_group_keys: list):
+        super().__init__()
+        self.footprints_data_grouped = footprints_data_grouped
+        self.sorted_group_keys = sorted_group_keys
+        self._group_keys: List[Tuple[Optional[str],Optional[str]]] = []
+        self._parent_keys: dict[FootprintData,Tuple[Optional[str],Optional[str]]] = {}
+        # Cell texts per group key or footprint, built on first display
+        self._rows: dict[object,Tuple[str,...]] = {}
+
+    def reload(self) -> None:
+        """Reset the rows to sorted_group_keys"""
+        self._group_keys = self.sorted_group_keys
+        # Filled per group once the view expands it, see GetChildren
+        self._parent_keys = {}
+        self._rows = {}
+
+    def GetColumnCount(self):
+        return 6
+
+    def GetColumnType(self, col):
+        return "string"
+
+    def GetChildren(self, parent, children):
+        if not parent:
+            for key in self._group_keys:
+                children.append(self.ObjectToItem(key))
+            return len(self._group_keys)
+        
+        node = self.ItemToObject(parent)
+        if isinstance(node, tuple):
+            footprints = self.footprints_data_grouped[node]
+            for fp in footprints:
+                self._parent_keys[fp] = node
+                children.append(self.ObjectToItem(fp))
+            return len(footprints)
+        return 0
+
+    def IsContainer(self, item):
+        if not item:
+            return True
+        return isinstance(self.ItemToObject(item), tuple)
+
+    def HasContainerColumns(self, item):
+        return True
+
+    def GetParent(self, item):
+        if not item:
+            return dv.NullDataViewItem
+        node = self.ItemToObject(item)
+        if isinstance(node, tuple):
+            return dv.NullDataViewItem
+        return self.ObjectToItem(self._parent_keys[node])
+
+    def _row(self, node) -> Tuple[str,...]:
+        """Cell texts of a group or footprint row"""
+        row = self._rows.get(node)
+        if row is not None:
+            return row
+        
+        if isinstance(node, tuple):
+            footprints = self.footprints_data_grouped[node]
+            refs = ", ".join(fp.reference for fp in footprints)
+            qty = str(len(footprints))
+            # Group rows show the PartDB data of their first footprint
+            fp = footprints[0]
+        else:
+            fp = node
+            refs = fp.reference
+            qty = "1"
+        
+        row = (refs, qty, fp.mpn or "", fp.partdb_id or "", fp.storage_location or "", fp.amount or "")
+        self._rows[node] = row
+        return row
+
+    def GetValue(self, item, col):
+        return self._row(self.ItemToObject(item))[col]
+
+    def groups_changed(self, keys: Iterable[Tuple[Optional[str],Optional[str]]]) -> None:
+        """Tell the view that the cells of the given groups and their shown footprints changed"""
+        items = dv.DataViewItemArray()
+        for key in keys:
+            self._rows.pop(key, None)
+            items.append(self.ObjectToItem(key))
+            # Footprints of never expanded groups are unknown to the view
+            for fp in self.footprints_data_grouped[key]:
+                self._rows.pop(fp, None)
+                if fp in self._parent_keys:
+                    items.append(self.ObjectToItem(fp))
+        if len(items):
+            self.ItemsChanged(items)
+
+    def SetValue(self, value, item, col):
+        # Read-only view
+        return False
+
+
+class FootprintTablePanel(wx.Panel):
+    """Displays the BOM tree with footprint data"""
+    
+    def __init__(self, parent:wx.Window, footprints_data_grouped: dict, sorted_group_keys: list):
+        super().__init__(parent)
+        
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        
+        # Title and label
+        title = wx.StaticText(self, label="Components")
+        title_font = title.GetFont()
+        title_font.MakeBold()
+        title.SetFont(title_font)
+        sizer.Add(title, 0, wx.ALL, 10)
+        
+        # Data view control backed by a virtual model
+        self.model = FootprintTreeModel(footprints_data_grouped, sorted_group_keys)
+        self.tree = dv.DataViewCtrl(
+            self, style=dv.DV_ROW_LINES | dv.DV_VERT_RULES
+        )
+        self.tree.AssociateModel(self.model)
+        self.tree.AppendTextColumn("References", 0, width=170)
+        self.tree.AppendTextColumn("Qty", 1, width=60)
+        self.tree.AppendTextColumn("MPN", 2, width=80)
+        self.tree.AppendTextColumn("PartDB ID", 3, width=150)
+        self.tree.AppendTextColumn("Storage Location", 4, width=150)
+        self.tree.AppendTextColumn("Storage Amount", 5, width=100)
+        
+        sizer.Add(self.tree, 1, wx.EXPAND | wx.ALL, 10)
+        self.SetSizer(sizer)
+        
+        self.update_table()
+    
+    def update_table(self):
+        """Refresh the tree with current footprint data"""
+
+        # Suspend repaints while the view drops and re-queries its rows
+        self.tree.Freeze()
+        try:
+            self.model.reload()
+            self.model.Cleared()
+        finally:
+            self.tree.Thaw()
+    
+    def set_data(self, footprints_data_grouped: dict, sorted_group_keys: list):
+        """Replace the displayed footprint data"""
+        self.model.footprints_data_grouped = footprints_data_grouped
+        self.model.sorted_group_keys = sorted_group_keys
+        self.update_table()
+    
+    def update_rows(self, keys: Iterable[Tuple[Optional[str],Optional[str]]]):
+        """Refresh only the rows of the given groups, keeping the tree layout"""
+        self.model.groups_changed(keys)
+
+
+# ============================================================================
+# PANEL: Action Buttons
+# ============================================================================
+class ActionButtonPanel(wx.Panel):
+    """Buttons: Save to Board, Close"""
+    
+    def __init__(self, parent, on_save: Callable, on_close: Callable):
+        super().__init__(parent)
+        
+        sizer = wx.BoxSizer(wx.HORIZONTAL)
+        sizer.AddStretchSpacer()
+        
+        save_btn = wx.Button(self, label="Save to Board")
+        save_btn.Bind(wx.EVT_BUTTON, lambda evt: on_save())
+        sizer.Add(save_btn, 0, wx.ALL | wx.CENTER, 5)
+        
+        close_btn = wx.Button(self, label="Close")
+        close_btn.Bind(wx.EVT_BUTTON, lambda evt: on_close())
+        sizer.Add(close_btn, 0, wx.ALL | wx.CENTER, 5)
+        
+        self.SetSizer(sizer)
+
+
+# ============================================================================
+# PANEL: Status Bar
+# ============================================================================
+class StatusBarPanel(wx.Panel):
+    """Simple status display at bottom"""
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        
+        self.status_text = wx.StaticText(self, label="Ready")
+        status_font = self.status_text.GetFont()
+        status_font.MakeItalic()
+        self.status_text.SetFont(status_font)
+        
+        sizer.Add(self.status_text, 0, wx.ALL, 10)
+        self.SetSizer(sizer)
+        
+        # Messages are applied on idle, so bursts of updates cost a single relabel
+        self._pending: Optional[str] = None
+        self.SetExtraStyle(self.GetExtraStyle() | wx.WS_EX_PROCESS_IDLE)
+        self.Bind(wx.EVT_IDLE, self._on_idle)
+    
+    def set_status(self, message: str):
+        """Update status message"""
+        self._pending = message
+    
+    def _on_idle(self, event):
+        if self._pending is not None:
+            if self._pending != self.status_text.GetLabel():
+                self.status_text.SetLabel(self._pending)
+            self._pending = None
+        event.Skip()
+
+
+# ============================================================================
+# MAIN FRAME: Controller
+# ============================================================================
+class PartDBPlugin(wx.Frame):
+    """Main frame that coordinates panels and manages PartDB instance"""
+    footprints_data_grouped:dict[Tuple[Optional[str],Optional[str]],List[FootprintData]]
+    sorted_group_keys:List[Tuple[Optional[str],Optional[str]]]
+    # Config file path and contents, only read from disk once per session
+    _config_path_cache:Optional[str] = None
+    _config_cache:Optional[dict] = None
+
+    def __init__(self):
+        super().__init__(None, title="PartDB Plugin", size=(900, 700))
+        
+        # Get board and load config
+        self.board = pcbnew.GetBoard()
+        api_url, token = self._load_config()
+        
+        # Initialize data, footprints are loaded once the frame is shown
+        self.partdb: Optional[PartDB] = None
+        self.footprints_data_grouped = {}
+        self.sorted_group_keys = []
+        self._load_dialog: Optional[wx.ProgressDialog] = None
+        
+        # Create main sizer
+        main_sizer = wx.BoxSizer(wx.VERTICAL)
+        
+        # Title
+        title = wx.StaticText(self, label="PartDB Synchronizer")
+        title_font = title.GetFont()
+        title_font.MakeBold()
+        title.SetFont(title_font)
+        main_sizer.Add(title, 0, wx.ALL, 10)
+        
+        # API Config Panel
+        self.api_panel = ApiConfigPanel(
+            self, 
+            api_url=api_url, 
+            token=token,
+            on_sync_click=self._on_api_panel_action
+        )
+        main_sizer.Add(self.api_panel, 0, wx.EXPAND | wx.ALL, 5)
+        
+        # Footprint Table Panel
+        self.table_panel = FootprintTablePanel(self, self.footprints_data_grouped, self.sorted_group_keys)
+        main_sizer.Add(self.table_panel, 1, wx.EXPAND | wx.ALL, 5)
+        
+        # Action Buttons Panel
+        self.action_panel = ActionButtonPanel(
+            self,
+            on_save=self._on_save,
+            on_close=self._on_close
+        )
+        main_sizer.Add(self.action_panel, 0, wx.EXPAND | wx.ALL, 5)
+        
+        # Status Bar Panel
+        self.status_panel = StatusBarPanel(self)
+        main_sizer.Add(self.status_panel, 0, wx.EXPAND | wx.ALL, 5)
+        
+        self.SetSizer(main_sizer)
+        self.Bind(wx.EVT_CLOSE, self._on_close)
+        
+        wx.CallAfter(self._load_board_footprints_async)
+    
+    def _load_board_footprints_async(self):
+        """Load footprints in a background thread behind a progress dialog"""
+        # App modal, so the board can't be edited while the worker reads it
+        self._load_dialog = wx.ProgressDialog(
+            "PartDB Plugin", "Loading footprints...",
+            parent=self, style=wx.PD_APP_MODAL
+        )
+        self.api_panel.sync_btn.Enable(False)
+        self.status_panel.set_status("Loading footprints...")
+        
+        thread = threading.Thread(target=self._load_thread)
+        thread.daemon = True
+        thread.start()
+    
+    def _load_thread(self):
+        """Background thread for loading the board footprints"""
+        try:
+            self._load_board_footprints(
+                on_progress=lambda count: wx.CallAfter(self._on_load_progress, count)
+            )
+            wx.CallAfter(self._on_load_complete)
+        except Exception as e:
+            logging.exception("Loading footprints failed")
+            wx.CallAfter(self._on_load_error, str(e))
+    
+    def _on_load_progress(self, count: int):
+        """Called in main thread while footprints are loading"""
+        if self._load_dialog:
+            self._load_dialog.Pulse(f"Loaded {count} footprints...")
+    
+    def _close_load_dialog(self):
+        if self._load_dialog:
+            self._load_dialog.Destroy()
+            self._load_dialog = None
+    
+    def _on_load_complete(self):
+        """Called in main thread after footprints are loaded"""
+        self._close_load_dialog()
+        self.table_panel.set_data(self.footprints_data_grouped, self.sorted_group_keys)
+        self.status_panel.set_status("Ready")
+        self.api_panel.sync_btn.Enable(True)
+    
+    def _on_load_error(self, error: str):
+        """Called in main thread after loading footprints fails"""
+        self._close_load_dialog()
+        self.status_panel.set_status(f"Error: {error}")
+        self.api_panel.sync_btn.Enable(True)
+        answer = wx.MessageBox(
+            f"Loading footprints failed:\n{error}\n\nRetry?", "Error",
+            wx.YES_NO | wx.ICON_ERROR
+        )
+        if answer == wx.YES:
+            self._load_board_footprints_async()
+    
+    def _on_api_panel_action(self, action: str, values: Tuple[str, str]):
+        """Handle actions from API panel"""
+        api_url, token = values
+        
+        if action == "save_config":
+            self._save_config(api_url, token)
+            self.status_panel.set_status("Configuration saved")
+        
+        elif action == "clear_cache":
+            if self.partdb:
+                self.partdb.clear_cache()
+            self.status_panel.set_status("PartDB cache cleared")
+        
+        elif action == "sync":
+            # Validate
+            if not api_url:
+                wx.MessageBox("Please enter a PartDB API URL", "Warning", wx.OK | wx.ICON_WARNING)
+                self.status_panel.set_status("Error: API URL is empty")
+                return
+            
+            if not token:
+                wx.MessageBox("Please enter a PartDB API Token", "Warning", wx.OK | wx.ICON_WARNING)
+                self.status_panel.set_status("Error: API Token is empty")
+                return
+            
+            # Disable button and show progress
+            self.api_panel.sync_btn.Enable(False)
+            self.status_panel.set_status("Synchronizing...")
+            wx.BeginBusyCursor()
+            
+            # Run sync in background thread
+            thread = threading.Thread(target=self._sync_thread, args=(api_url, token))
+            thread.daemon = True
+            thread.start()
+    
+    def _sync_thread(self, api_url: str, token: str):
+        """Background thread for synchronization"""
+        try:
+            # Reuse the PartDB instance, and with it the response cache, while the settings are unchanged
+            if not self.partdb or (self.partdb.base_url, self.partdb.bearer) != (api_url, token):
+                self.partdb = PartDB(bearer=token, base_url=api_url)
+            
+            # Fetch all parts up front, then update footprint data
+            parts = self.partdb.get_parts_from_ids(
+                partdb_id for (_, partdb_id) in self.footprints_data_grouped if partdb_id
+            )
+            touched = []
+            for key, footprints in self.footprints_data_grouped.items():
+                mpn, partdb_id = key
+                if not partdb_id:
+                    continue
+                
+                partdb_part = parts.get(partdb_id)
+                if partdb_part:
+                    for fp in footprints:
+                        fp.partdb_part = partdb_part
+                    touched.append(key)
+            
+            logging.debug(f"Sync complete: {len(touched)} of {len(self.footprints_data_grouped)} groups updated")
+            wx.CallAfter(self._on_sync_complete, touched)
+        
+        except Exception as e:
+            logging.exception("Sync failed")
+            wx.CallAfter(self._on_sync_error, str(e))
+    
+    def _on_sync_complete(self, touched: List[Tuple[Optional[str],Optional[str]]]):
+        """Called in main thread after sync succeeds"""
+        wx.EndBusyCursor()
+        self.table_panel.update_rows(touched)
+        self.status_panel.set_status("Synchronization completed successfully")
+        self.api_panel.sync_btn.Enable(True)
+    
+    def _on_sync_error(self, error: str):
+        """Called in main thread after sync fails"""
+        wx.EndBusyCursor()
+        self.status_panel.set_status(f"Error: {error}")
+        self.api_panel.sync_btn.Enable(True)
+        wx.MessageBox(f"Sync failed:\n{error}", "Error", wx.OK | wx.ICON_ERROR)
+    
+    def _on_save(self):
+        """Save footprint data back to board"""
+        try:
+            self.status_panel.set_status("Saving to board...")
+            count = FootprintData.batch_update_storage_location(
+                itertools.chain.from_iterable(self.footprints_data_grouped.values())
+            )
+            self.status_panel.set_status(f"Saved to board successfully, {count} footprints updated")
+        except Exception as e:
+            logging.exception("Save failed")
+            self.status_panel.set_status(f"Error: {e}")
+            wx.MessageBox(f"Save failed:\n{e}", "Error", wx.OK | wx.ICON_ERROR)
+    
+    def _on_close(self, event=None):
+        """Close the frame"""
+        logging.debug("Closing PartDB Plugin")
+        self.Destroy()
+    
+    def _load_board_footprints(self, on_progress: Optional[Callable[[int], None]] = None) -> None:
+        """Load footprints from board, reporting the count to on_progress every 100 footprints"""
+        groups: dict[Tuple[Optional[str],Optional[str]],List[FootprintData]] = {}
+        pcbnew_footprints: List[pcbnew.FOOTPRINT] = self.board.GetFootprints()
+        
+        # Filter, wrap and group in a single pass over the board
+        count = 0
+        for pcbnew_fp in pcbnew_footprints:
+            if pcbnew_fp.IsExcludedFromBOM():
+                continue
+            fp = FootprintData(pcbnew_fp)
+            groups.setdefault((fp.mpn, fp.partdb_id), []).append(fp)
+            count += 1
+            if on_progress and count % 100 == 0:
+                on_progress(count)
+        
+        self.footprints_data_grouped = groups
+        # Groups only change on load, so sort them once here instead of on every table refresh
+        self.sorted_group_keys = sorted(groups, key=_null_last_key)
+        
+        logging.debug(f"Loaded {count} footprints")
+    
+    @staticmethod
+    def _get_global_config_file() -> str:
+        """Get config file path"""
+        if PartDBPlugin._config_path_cache is None:
+            settings_path = SETTINGS_MANAGER.GetUserSettingsPath()
+            plugin_dir = os.path.join(settings_path, "plugins", "partdb-kicad-plugin")
+            os.makedirs(plugin_dir, exist_ok=True)
+            PartDBPlugin._config_path_cache = os.path.join(plugin_dir, "config.json")
+        return PartDBPlugin._config_path_cache
+    
+    @staticmethod
+    def _save_config(api_url: str, token: str):
+        """Save configuration to file"""
+        config_file = PartDBPlugin._get_global_config_file()
+        config = {"api_url": api_url, "token": token}
+        with open(config_file, 'w') as f:
+            json.dump(config, f, indent=2)
+        PartDBPlugin._config_cache = config
+    
+    @staticmethod
+    def _load_config() -> Tuple[str, str]:
+        """Load configuration from file"""
+        config = PartDBPlugin._config_cache
+        if config is None:
+            config_file = PartDBPlugin._get_global_config_file()
+            
+            if not os.path.exists(config_file):
+                return ('https://partdb.example.com/api', '')
+            
+            with open(config_file, 'r') as f:
+                config = json.load(f)
+            PartDBPlugin._config_cache = config
+        
+        return (config.get('api_url', ''), config.get('token', ''))
@@ -1,9 +1,12 @@
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
 
 from .part import Part, Project
 
 import json
+import time
 from datetime import datetime
+from urllib.parse import urljoin
 
 import logging
 logger = logging.getLogger(__name__)
@@ -15,6 +18,32 @@ from requests.exceptions import HTTPError
 from urllib3.util.retry import Retry
 
 
+def _make_retry(retries: int) -> Retry:
+    """Build the retry strategy shared by all API clients."""
+    return Retry(
+        total=retries,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"]
+    )
+
+# Retry objects are immutable, so the default one is built once and shared
+_DEFAULT_RETRY = _make_retry(3)
+
+# Connections kept alive per host, sized for the concurrent part fetches
+POOL_MAXSIZE = 16
+
+
+# Collections only carry the hydra: keys when requested as JSON-LD
+HYDRA_HEADERS = {'Accept': 'application/ld+json'}
+
+
+def _make_adapter(retries: int = 3) -> HTTPAdapter:
+    """Build a connection pool adapter using the shared retry strategy."""
+    retry_strategy = _DEFAULT_RETRY if retries == _DEFAULT_RETRY.total else _make_retry(retries)
+    return HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=retry_strategy)
+
+
 class APIClient:
     """
     A robust API client for fetching data from JSON APIs using the requests library.
@@ -47,13 +76,7 @@ class APIClient:
         self.session = requests.Session()
         
         # Configure retry strategy
-        retry_strategy = Retry(
-            total=retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = _make_adapter(retries)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
         
@@ -64,19 +87,40 @@ class APIClient:
             'User-Agent': 'Python-API-Client/1.0'
         }
         self.session.headers.update(self.default_headers)
+        
+        # Conditional GET cache: url -> (validator headers, parsed body)
+        self._response_cache: Dict[str, Tuple[Dict[str, str], Dict[str, Any]]] = {}
     
     def _build_url(self, endpoint: str) -> str:
         """
         Build the complete URL.
         
         Args:
-            endpoint: API endpoint path
+            endpoint: API endpoint path or absolute URL
             
         Returns:
             Complete URL
         """
+        if endpoint.startswith(('http://', 'https://')):
+            return endpoint
         return f"{self.base_url}/{endpoint.lstrip('/')}"
     
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict[str, Any]]) -> str:
+        """
+        Build the response cache key for a GET request.
+        
+        Args:
+            url: Complete URL
+            params: Optional query parameters
+            
+        Returns:
+            URL including the encoded query string
+        """
+        prepared = requests.PreparedRequest()
+        prepared.prepare_url(url, params)
+        return prepared.url or url
+    
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """
         Handle the response and raise exceptions for HTTP errors.
@@ -107,16 +151,22 @@ class APIClient:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
+        refresh: bool = False,
         **kwargs
     ) -> Dict[str, Any]:
         """
         Perform a GET request.
         
+        Responses carrying an ETag or Last-Modified header are cached, later
+        requests for the same URL are sent as conditional GETs and a 304 is
+        answered from the cache.
+        
         Args:
             endpoint: API endpoint path
             params: Optional query parameters
             headers: Optional additional headers
             timeout: Optional request timeout in seconds
+            refresh: Drop any cached response and fetch unconditionally
             **kwargs: Additional arguments to pass to requests.get()
             
         Returns:
@@ -125,6 +175,13 @@ class APIClient:
         url = self._build_url(endpoint)
         merged_headers = self._merge_headers(headers)
         
+        cache_key = self._cache_key(url, params)
+        if refresh:
+            self._response_cache.pop(cache_key, None)
+        cached = self._response_cache.get(cache_key)
+        if cached:
+            merged_headers = {**merged_headers, **cached[0]}
+        
         try:
             response = self.session.get(
                 url,
@@ -133,9 +190,20 @@ class APIClient:
                 timeout=timeout or self.timeout,
                 **kwargs
             )
-            return self._handle_response(response)
+            if cached and response.status_code == 304:
+                return cached[1]
+            
+            data = self._handle_response(response)
+            validators = {}
+            if 'ETag' in response.headers:
+                validators['If-None-Match'] = response.headers['ETag']
+            if 'Last-Modified' in response.headers:
+                validators['If-Modified-Since'] = response.headers['Last-Modified']
+            if validators:
+                self._response_cache[cache_key] = (validators, data)
+            return data
         except requests.exceptions.RequestException as e:
-            print(f"GET request failed: {e}")
+            logger.error("GET request failed: %s", e)
             raise
     
     def post(
@@ -178,7 +246,7 @@ class APIClient:
             )
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
-            print(f"POST request failed: {e}")
+            logger.error("POST request failed: %s", e)
             raise
     
     def put(
@@ -221,7 +289,7 @@ class APIClient:
             )
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
-            print(f"PUT request failed: {e}")
+            logger.error("PUT request failed: %s", e)
             raise
     
     def patch(
@@ -264,7 +332,7 @@ class APIClient:
             )
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
-            print(f"PATCH request failed: {e}")
+            logger.error("PATCH request failed: %s", e)
             raise
     
     def delete(
@@ -301,7 +369,7 @@ class APIClient:
             )
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
-            print(f"DELETE request failed: {e}")
+            logger.error("DELETE request failed: %s", e)
             raise
     
     def _merge_headers(self, additional_headers: Optional[Dict[str, str]]) -> Dict[str, str]:
@@ -320,6 +388,10 @@ class APIClient:
             return merged
         return self.default_headers
     
+    def clear_cache(self):
+        """Drop all cached GET responses."""
+        self._response_cache.clear()
+    
     def close(self):
         """Close the session and release resources."""
         self.session.close()
@@ -367,29 +439,138 @@ class AuthenticatedAPIClient(APIClient):
 class PartDB:
     bearer:str
     base_url:str
+    cache_ttl:float
 
-    def __init__(self, bearer:str,base_url:str ) -> None:
+    def __init__(self, bearer:str,base_url:str, cache_ttl:float=300) -> None:
         self.bearer = bearer
         self.base_url = base_url
+        self.cache_ttl = cache_ttl
         self.client = AuthenticatedAPIClient(
             base_url=self.base_url, 
             api_key=self.bearer
         )
+        # PartDB ID -> (monotonic fetch time, part)
+        self._part_cache: Dict[str, Tuple[float, Part]] = {}
+        # Whether the parts collection honours the id[] filter, None until probed
+        self._id_filter_supported: Optional[bool] = None
         logging.debug(f'Initialized PartDB with {base_url=}')
 
+    def _cached_part(self, id:str) -> Optional[Part]:
+        entry = self._part_cache.get(id)
+        if entry and time.monotonic() - entry[0] < self.cache_ttl:
+            return entry[1]
+        return None
+
+    def _cache_part(self, id:str, part:Part) -> None:
+        self._part_cache[id] = (time.monotonic(), part)
+
+    def clear_cache(self) -> None:
+        """Forget all cached parts and responses"""
+        self._part_cache.clear()
+        self.client.clear_cache()
+
     def get_part_from_id(self,id:str) -> Optional[Part]:
+        part = self._cached_part(id)
+        if part:
+            return part
         try:
             data = self.client.get(f'parts/{id}')
             part = Part.from_dict(data)
+            self._cache_part(id, part)
             return part 
         except Exception as e :
             logging.exception('Error building Part instance from data')
             return None
         
+    def get_parts_from_ids(self, ids:Iterable[str], max_workers:int=POOL_MAXSIZE, chunk_size:int=100) -> Dict[str, Optional[Part]]:
+        """
+        Fetch several parts, keyed by PartDB ID.
+
+        If the server's parts collection honours the id[] filter, parts are
+        requested from it in chunks. Any id not returned that way is fetched
+        from the item endpoint, concurrently.
+        """
+        parts: Dict[str, Optional[Part]] = {}
+        to_fetch: List[str] = []
+        for part_id in dict.fromkeys(ids):
+            part = self._cached_part(part_id)
+            if part:
+                parts[part_id] = part
+            else:
+                to_fetch.append(part_id)
+        
+        if to_fetch and self._probe_id_filter(to_fetch[0]):
+            for start in range(0, len(to_fetch), chunk_size):
+                parts.update(self._get_parts_chunk(to_fetch[start:start + chunk_size]))
+                if not self._id_filter_supported:
+                    break
+        
+        missing = [part_id for part_id in to_fetch if part_id not in parts]
+        if missing:
+            # Requests are independent, overlap their round trips on the pooled session
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                parts.update(zip(missing, executor.map(self.get_part_from_id, missing)))
+        return parts
+
+    def _probe_id_filter(self, part_id:str) -> bool:
+        """
+        Check once per instance whether the parts collection filters by id[].
+
+        API Platform silently ignores unknown filters, so the filter counts as
+        supported only if a single id query reports at most one item.
+        """
+        if self._id_filter_supported is None:
+            try:
+                data = self.client.get('parts', params={'id[]': [part_id], 'itemsPerPage': 1}, headers=HYDRA_HEADERS)
+                total = data.get("hydra:totalItems") if isinstance(data, dict) else None
+            except Exception as e :
+                # Not remembered, a later sync probes again
+                logging.exception('Error probing the parts id filter')
+                return False
+            supported = total is not None and total <= 1
+            if not supported:
+                logging.debug('Parts collection ignores the id[] filter, fetching parts one by one')
+            self._id_filter_supported = supported
+        return bool(self._id_filter_supported)
+
+    def _get_parts_chunk(self, ids:List[str]) -> Dict[str, Part]:
+        """Fetch one page of parts filtered by id, skipping anything not requested"""
+        wanted = set(ids)
+        parts: Dict[str, Part] = {}
+        try:
+            data = self.client.get('parts', params={'id[]': ids, 'itemsPerPage': len(ids)}, headers=HYDRA_HEADERS)
+            total = data.get("hydra:totalItems") if isinstance(data, dict) else None
+            if total is None or total > len(ids):
+                # The result was not filtered, leave everything to the item endpoint
+                self._id_filter_supported = False
+                return parts
+            for part_data in data.get("hydra:member", []):
+                part_id = str(part_data.get('id'))
+                if part_id not in wanted:
+                    continue
+                if 'partLots' not in part_data:
+                    # The collection omits lots, the item endpoint has to be asked anyway
+                    self._id_filter_supported = False
+                    return {}
+                parts[part_id] = Part.from_dict(part_data)
+                self._cache_part(part_id, parts[part_id])
+        except Exception as e :
+            logging.exception('Error fetching parts in bulk')
+        return parts
+        
+    def _iter_collection(self, endpoint:str) -> Iterator[Dict[str, Any]]:
+        """Yield the members of a Hydra collection, fetching one page at a time"""
+        next_page: Optional[str] = endpoint
+        while next_page:
+            data = self.client.get(next_page, headers=HYDRA_HEADERS)
+            yield from data.get("hydra:member", [])
+            next_path = data.get("hydra:view", {}).get("hydra:next")
+            # hydra:next is a server absolute path, resolve it against the API host
+            next_page = urljoin(self.client.base_url, next_path) if next_path else None
+
     def list_projects(self):
         try:
-            data = self.client.get('projects')
-            projects = [Project.from_dict(proj_data) for proj_data in data["hydra:member"]]
+            projects = [Project.from_dict(proj_data) for proj_data in self._iter_collection('projects')]
             return projects
         except Exception as e :
             logging.exception('Error fetching projects')
@@ -15,37 +15,71 @@ E = TypeVar('E')
 import logging
 
 class APIObject:
+    # Annotated attribute names, collected once per class
+    __fields__ = ()
+
+    def __init_subclass__(cls, **kwargs:Any) -> None:
+        super().__init_subclass__(**kwargs)
+        fields: Dict[str, None] = {}
+        for klass in reversed(cls.__mro__):
+            fields.update(dict.fromkeys(klass.__dict__.get('__annotations__', {})))
+        cls.__fields__ = tuple(fields)
+
     def __init__(self, data_dict:Dict[str, Any]) -> None:
-        for attr,_ in self.__annotations__:
+        for attr in self.__fields__:
             value:Any = data_dict.get(attr)
-            if value:
+            if value is not None:
                 setattr(self, attr, value)
 
-class AutoInit:
+class _AutoSlots(type):
+    """Metaclass deriving __slots__ from the annotations of the class body"""
+    def __new__(mcs, name:str, bases:tuple, namespace:Dict[str, Any], **kwargs:Any) -> Any:
+        if '__slots__' not in namespace:
+            namespace['__slots__'] = tuple(namespace.get('__annotations__', {}))
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+class AutoInit(metaclass=_AutoSlots):
     def __init__(self, **kwargs:Any) -> None:
         for k, v in kwargs.items():
             setattr(self, k, v)
+
+    def __init_subclass__(cls, **kwargs:Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._fast_from_dict = classmethod(_compile_from_dict(cls))
     
     @classmethod
     def from_dict(cls: Type[T], data: dict[str, object]) -> T:
-        params = getattr(cls, '__annotations__', {})
-        init_data: dict[str, object] = {}
-        for key, field_type in params.items():
-            if key in data:
-                value = data[key]
-                origin = get_origin(field_type)
-                args = get_args(field_type)
+        return cls._fast_from_dict(data)
+
+def _compile_from_dict(cls: type) -> Any:
+    """
+    Generate a from_dict specialised for the annotations of cls.
 
-                # Handle nested dataclass-like classes
-                if hasattr(field_type, '__annotations__') and isinstance(value, dict):
-                    value = field_type.from_dict(value)
-                # Handle list of nested objects
-                elif origin in (list, List) and args and isinstance(value, list):
-                    element_type = args[0]
-                    if hasattr(element_type, 'from_dict'):
-                        value = [element_type.from_dict(item) if isinstance(item, dict) else item for item in value]
-                init_data[key] = value
-        return cls(**init_data)
+    The nested/list/scalar decision for each field is taken once here instead
+    of on every call, leaving plain dict lookups for the generated function.
+    """
+    params = getattr(cls, '__annotations__', {})
+    namespace: Dict[str, Any] = {}
+    lines = ['def _fast_from_dict(cls, data):', '    init_data = {}']
+    for i, (key, field_type) in enumerate(params.items()):
+        origin = get_origin(field_type)
+        args = get_args(field_type)
+        lines.append(f'    if {key!r} in data:')
+        lines.append(f'        value = data[{key!r}]')
+        # Handle nested dataclass-like classes
+        if hasattr(field_type, '__annotations__'):
+            namespace[f'_t{i}'] = field_type
+            lines.append('        if isinstance(value, dict):')
+            lines.append(f'            value = _t{i}.from_dict(value)')
+        # Handle list of nested objects
+        elif origin in (list, List) and args and hasattr(args[0], 'from_dict'):
+            namespace[f'_t{i}'] = args[0]
+            lines.append('        if isinstance(value, list):')
+            lines.append(f'            value = [_t{i}.from_dict(item) if isinstance(item, dict) else item for item in value]')
+        lines.append(f'        init_data[{key!r}] = value')
+    lines.append('    return cls(**init_data)')
+    exec('\n'.join(lines), namespace)
+    return namespace['_fast_from_dict']
 
 class Storage(AutoInit):
     id:int
@@ -3,7 +3,9 @@ import wx
 class ProjectControl(wx.Panel):
     def __init__(self, parent, projects):
         super().__init__(parent)
-        self.projects = projects
+        self.projects = list(projects)
+        # Mirror of self.projects for constant time duplicate checks
+        self._projects_set = set(self.projects)
 
         sizer = wx.BoxSizer(wx.HORIZONTAL)
 
@@ -28,7 +30,8 @@ class ProjectControl(wx.Panel):
         dlg = wx.TextEntryDialog(self, "Enter new project name:", "New Project")
         if dlg.ShowModal() == wx.ID_OK:
             new_name = dlg.GetValue()
-            if new_name and new_name not in self.projects:
+            if new_name and new_name not in self._projects_set:
+                self._projects_set.add(new_name)
                 self.projects.append(new_name)
                 self.listbox.Append(new_name)
                 self.listbox.SetSelection(len(self.projects)-1)